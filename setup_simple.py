@@ -8,11 +8,11 @@ import subprocess
 import sys
 import os
 
-def run_command(command, description):
-    """Run a command and handle errors"""
+def run_command(argv, description):
+    """Run a command (given as an argument list, no shell) and handle errors"""
     print(f"🔄 {description}...")
     try:
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
+        result = subprocess.run(argv, check=True, capture_output=True, text=True)
         print(f"✅ {description} completed successfully!")
         return True
     except subprocess.CalledProcessError as e:
@@ -35,7 +35,8 @@ def main():
     
     # Install dependencies
     print("\n📦 Installing dependencies...")
-    if not run_command("pip install -r simple_requirements.txt", "Installing Python packages"):
+    pip_install = [sys.executable, "-m", "pip", "install", "-r", "simple_requirements.txt"]
+    if not run_command(pip_install, "Installing Python packages"):
         print("❌ Failed to install dependencies. Please check your internet connection and try again.")
         return
     
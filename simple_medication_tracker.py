@@ -5,11 +5,15 @@ A lightweight medication tracking app that stores data locally in CSV format.
 No server required - just run this script directly!
 """
 
+import atexit
 import csv
+import io
+import mmap
 import os
-from datetime import datetime
+from datetime import date, datetime, timedelta
 import re
-from typing import Dict, Optional, List
+import threading
+from typing import Dict, Iterable, Iterator, Optional, List, Tuple
 import json
 import logging
 
@@ -17,6 +21,84 @@ import logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Extraction patterns for medication descriptions, compiled once at import
+_EXTRACT_PATTERNS = tuple(re.compile(p) for p in [
+    # "I'm taking 10mg of aspirin"
+    r"(?:taking|took|take)\s+(\d+(?:\.\d+)?)\s*(mg|ml|pills?|tablets?|units?|capsules?)\s+(?:of\s+)?(.+)",
+    # "I'm taking aspirin 10mg"
+    r"(?:taking|took|take)\s+(.+?)\s+(\d+(?:\.\d+)?)\s*(mg|ml|pills?|tablets?|units?|capsules?)",
+    # "10mg aspirin"
+    r"(\d+(?:\.\d+)?)\s*(mg|ml|pills?|tablets?|units?|capsules?)\s+(?:of\s+)?(.+)",
+    # "aspirin 10mg"
+    r"(.+?)\s+(\d+(?:\.\d+)?)\s*(mg|ml|pills?|tablets?|units?|capsules?)",
+    # "one pill of aspirin" or "two tablets of tylenol"
+    r"(?:taking|took|take)\s+(one|two|three|four|five|six|seven|eight|nine|ten|a|an)\s+(pill|tablet|capsule)\s+(?:of\s+)?(.+)",
+    # "aspirin one pill"
+    r"(?:taking|took|take)\s+(.+?)\s+(one|two|three|four|five|six|seven|eight|nine|ten|a|an)\s+(pill|tablet|capsule)",
+])
+
+# Number word to digit mapping
+NUMBER_WORDS = {
+    'one': '1', 'two': '2', 'three': '3', 'four': '4', 'five': '5',
+    'six': '6', 'seven': '7', 'eight': '8', 'nine': '9', 'ten': '10',
+    'a': '1', 'an': '1'
+}
+_NUM_RE = re.compile(r'\d+(?:\.\d+)?')
+
+# Filler words stripped from free-text medication mentions
+_FALLBACK_SUB = re.compile(r'\b(i am|taking|took|take|some|medication|medicine|pill|tablet|capsule|mg|ml)\b')
+# Substrings covering every _FALLBACK_SUB word; if none occur the substitution is a no-op
+_FALLBACK_HINTS = ('i am', 'tak', 'took', 'some', 'medic', 'pill', 'tablet', 'capsule', 'mg', 'ml')
+
+# Question patterns, one alternation per kind; time questions take priority over
+# dosage questions. Each alternative captures the medication in its only group.
+_TIME_Q_RE = re.compile('|'.join([
+    r"when (?:did i|was the last time i) (?:take|took)\s+(.+)",
+    r"when .* last .* (?:take|took)\s+(.+)",
+    r"what time .* last .* (?:take|took)\s+(.+)",
+]))
+_DOSAGE_Q_RE = re.compile('|'.join([
+    r"how much\s+(.+?)\s+did i take last",
+    r"what (?:was|is) my last dose of\s+(.+)",
+    r"what (?:was|is) the last dosage of\s+(.+)",
+]))
+
+# Trigger phrases - more natural for older adults (shared with simple_server)
+TRIGGER_PHRASES = (
+    "i am about to take some medication",
+    "i'm about to take some medication",
+    "about to take medication",
+    "taking medication now",
+    "i am taking medication",
+    "i need to take my medication",
+    "time to take my medication",
+    "remind me to take my medication",
+    "i'm taking my medicine",
+    "medicine time",
+    "pill time",
+    "i'm about to take my pills",
+    "time for my medication",
+    "i'm going to take my medication",
+)
+TRIGGER_RE = re.compile('|'.join(map(re.escape, TRIGGER_PHRASES)))
+
+# Replies sent after a successful log (shared with simple_server), filled from the extracted info
+LOGGED_MESSAGE = "Perfect! I've logged {medication} - {dosage} at {timestamp}"
+LOGGED_RESPONSE = "Great! I've recorded that you took {medication} {dosage} at {timestamp}. Your medication has been logged."
+
+# Fixed column layout of the CSV log
+CSV_HEADER = ('Date', 'Time', 'Medication', 'Dosage', 'Notes')
+
+# Initial number of trailing bytes scanned by get_recent_medications (doubled as needed)
+_TAIL_WINDOW = 16 * 1024
+
+def _cutoff_date(days: int) -> date:
+    """Return today minus days, clamped to the representable date range."""
+    try:
+        return date.today() - timedelta(days=days)
+    except OverflowError:
+        return date.min if days > 0 else date.max
+
 class SimpleMedicationTracker:
     def __init__(self, csv_file: str = None):
         """Initialize the medication tracker with a CSV file
@@ -24,7 +106,20 @@ class SimpleMedicationTracker:
         """
         configured_path = csv_file or os.getenv("MEDS_CSV_PATH", "medications.csv")
         self.csv_file = configured_path
+        # Most recent row per lowercased medication name, loaded lazily from the CSV.
+        # A published dict is never mutated; updates build a new one and swap it in,
+        # so readers can use it without taking the lock.
+        self._last_by_med: Dict[str, List[str]] = {}
+        # (mtime_ns, size) of the CSV the index reflects; None until loaded
+        self._index_stat: Optional[Tuple[int, int]] = None
+        # Whether the Date column is non-decreasing (so a tail read suffices), and its last value
+        self._dates_in_order = False
+        self._last_date = ''
+        # Guards the shared append handle and the index against concurrent writers
+        self._write_lock = threading.Lock()
+        self._fh = None
         self.setup_csv_file()
+        atexit.register(self._close_append_handle)
     
     def setup_csv_file(self):
         """Create CSV file with headers if it doesn't exist"""
@@ -45,7 +140,7 @@ class SimpleMedicationTracker:
             try:
                 with open(self.csv_file, 'w', newline='', encoding='utf-8') as file:
                     writer = csv.writer(file)
-                    writer.writerow(['Date', 'Time', 'Medication', 'Dosage', 'Notes'])
+                    writer.writerow(CSV_HEADER)
                 logger.info(f"✅ Created new medication log: {self.csv_file}")
             except (PermissionError, FileNotFoundError):
                 # Final fallback to project-local data path
@@ -54,8 +149,66 @@ class SimpleMedicationTracker:
                 self.csv_file = os.path.join(fallback_dir, 'medications.csv')
                 with open(self.csv_file, 'w', newline='', encoding='utf-8') as file:
                     writer = csv.writer(file)
-                    writer.writerow(['Date', 'Time', 'Medication', 'Dosage', 'Notes'])
+                    writer.writerow(CSV_HEADER)
                 logger.info(f"✅ Created new medication log (fallback): {self.csv_file}")
+        
+        # Keep one append handle open instead of reopening the file per entry
+        try:
+            self._open_append_handle()
+        except OSError as e:
+            # add_medication retries the open and reports the failure for each entry
+            logger.error(f"❌ Cannot open medication log for writing: {e}")
+
+    def _open_append_handle(self) -> None:
+        """Open the append handle, writing the header first if the file is missing.
+        The handle is unbuffered, so nothing from a failed write stays queued for the next one.
+        """
+        new_file = not os.path.exists(self.csv_file)
+        self._fh = open(self.csv_file, 'ab', buffering=0)
+        if new_file:
+            self._append_row(CSV_HEADER)
+            logger.info(f"✅ Recreated medication log: {self.csv_file}")
+
+    def _close_append_handle(self) -> None:
+        """Close the append handle if one is open."""
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+    def _append_row(self, row) -> None:
+        """Append one CSV record in a single write, rolling the file back if it fails."""
+        buf = io.StringIO()
+        csv.writer(buf).writerow(row)
+        data = buf.getvalue().encode('utf-8')
+        fd = self._fh.fileno()
+        offset = os.fstat(fd).st_size
+        try:
+            written = self._fh.write(data)
+            if written != len(data):
+                raise OSError(f"short write to medication log ({written} of {len(data)} bytes)")
+        except BaseException:
+            # Drop any partial record so a retry can't leave a fragment or a duplicate dose
+            try:
+                os.ftruncate(fd, offset)
+            except OSError:
+                pass
+            self._close_append_handle()
+            raise
+
+    def _ensure_append_handle(self) -> None:
+        """Reopen the append handle if the CSV was replaced, moved or deleted since it was opened
+        (e.g. saved from Excel), so new entries land in the file on disk.
+        """
+        if self._fh is not None:
+            try:
+                on_disk = os.stat(self.csv_file)
+                opened = os.fstat(self._fh.fileno())
+                if (on_disk.st_ino, on_disk.st_dev) == (opened.st_ino, opened.st_dev):
+                    return
+            except FileNotFoundError:
+                pass
+            self._close_append_handle()
+        self._open_append_handle()
 
     def _med_matches(self, recorded: str, queried: str) -> bool:
         """Return True if medication names look like a match (case-insensitive, substring)."""
@@ -65,121 +218,131 @@ class SimpleMedicationTracker:
             return False
         return q in r or r in q
 
+    @staticmethod
+    def _index_row(index: Dict[str, List[str]], row: List[str]) -> None:
+        """Record row as the latest entry for its medication, keeping index ordered by recency."""
+        key = row[2].strip().lower()
+        if not key:
+            return
+        index.pop(key, None)
+        index[key] = row
+
+    def _stat_key(self) -> Optional[Tuple[int, int]]:
+        """Return (mtime_ns, size) of the CSV file, or None if it can't be stat'ed."""
+        try:
+            st = os.stat(self.csv_file)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def _load_index(self) -> None:
+        """Build the last-entry index with a single streaming pass over the CSV."""
+        # Stat before reading, so a change made during the pass triggers another reload
+        stat_key = self._stat_key()
+        index: Dict[str, List[str]] = {}
+        in_order, last_date = True, ''
+        if os.path.exists(self.csv_file):
+            with open(self.csv_file, 'r', newline='', encoding='utf-8') as file:
+                reader = csv.reader(file)
+                next(reader, None)  # skip header
+                for row in reader:
+                    if len(row) < 5:
+                        continue
+                    self._index_row(index, row)
+                    if len(row[0]) == 10:
+                        if row[0] < last_date:
+                            in_order = False
+                        last_date = row[0]
+        # Publish the finished index before the stat key that marks it current
+        self._last_by_med = index
+        self._dates_in_order, self._last_date = in_order, last_date
+        self._index_stat = stat_key
+
+    def _refresh_index(self) -> None:
+        """Reload the index if the file changed outside this tracker (e.g. edited by hand)."""
+        stat_key = self._stat_key()
+        if stat_key is None or stat_key != self._index_stat:
+            with self._write_lock:
+                if self._index_stat is None or self._stat_key() != self._index_stat:
+                    self._load_index()
+
     def find_last_entry_for_medication(self, medication_query: str) -> Optional[Dict[str, str]]:
         """Find the most recent CSV row for the given medication name."""
         try:
-            if not os.path.exists(self.csv_file):
-                return None
-            with open(self.csv_file, 'r', newline='', encoding='utf-8') as file:
-                reader = list(csv.DictReader(file))
-                for row in reversed(reader):
-                    if self._med_matches(row.get('Medication', ''), medication_query):
-                        return row
+            self._refresh_index()
+            index = self._last_by_med
+            row = index.get((medication_query or "").strip().lower())
+            if row:
+                return dict(zip(CSV_HEADER, row))
+            # Fall back to a substring match over known medication names, newest first
+            for key in reversed(index):
+                if self._med_matches(key, medication_query):
+                    return dict(zip(CSV_HEADER, index[key]))
         except Exception as e:
             logger.error(f"❌ Error searching last entry: {e}")
         return None
 
     def answer_question(self, text: str) -> Optional[Dict]:
-        """Answer simple questions like 'when was the last time I took X' or 'how much X did I take last'."""
+        """Answer simple questions like 'when was the last time I took X' or 'how much X did I take last'.
+        Expects text already lowercased and stripped by the caller.
+        """
         if not text:
             return None
-        q = text.lower().strip()
-
-        # Patterns to extract medication for time query
-        time_patterns = [
-            r"when (?:did i|was the last time i) (?:take|took)\s+(.+)",
-            r"when .* last .* (?:take|took)\s+(.+)",
-            r"what time .* last .* (?:take|took)\s+(.+)"
-        ]
-
-        # Patterns to extract medication for dosage query
-        dosage_patterns = [
-            r"how much\s+(.+?)\s+did i take last",
-            r"what (?:was|is) my last dose of\s+(.+)",
-            r"what (?:was|is) the last dosage of\s+(.+)"
-        ]
-
-        import re as _re
 
+        m = _TIME_Q_RE.search(text)
+        is_time_query = m is not None
+        if not m:
+            m = _DOSAGE_Q_RE.search(text)
+            if not m:
+                return None
+        
+        med = m.group(m.lastindex).strip().rstrip('?!.')
+        row = self.find_last_entry_for_medication(med)
+        if not row:
+            return {"status": "answer", "message": f"I couldn't find any {med} in your log."}
+        
+        date = row.get('Date', '')
+        time_str = row.get('Time', '')
+        med_name = row.get('Medication', '')
+        
         # Time query
-        for p in time_patterns:
-            m = _re.search(p, q)
-            if m:
-                med = m.group(1).strip().rstrip('?!.')
-                row = self.find_last_entry_for_medication(med)
-                if row:
-                    date = row.get('Date', '')
-                    time_str = row.get('Time', '')
-                    med_name = row.get('Medication', '')
-                    return {
-                        "status": "answer",
-                        "message": f"Your last {med_name} was on {date} at {time_str}.",
-                        "data": {"medication": med_name, "date": date, "time": time_str}
-                    }
-                return {"status": "answer", "message": f"I couldn't find any {med} in your log."}
-
+        if is_time_query:
+            return {
+                "status": "answer",
+                "message": f"Your last {med_name} was on {date} at {time_str}.",
+                "data": {"medication": med_name, "date": date, "time": time_str}
+            }
+        
         # Dosage query
-        for p in dosage_patterns:
-            m = _re.search(p, q)
-            if m:
-                med = m.group(1).strip().rstrip('?!.')
-                row = self.find_last_entry_for_medication(med)
-                if row:
-                    dosage = row.get('Dosage', '')
-                    med_name = row.get('Medication', '')
-                    date = row.get('Date', '')
-                    time_str = row.get('Time', '')
-                    return {
-                        "status": "answer",
-                        "message": f"Your last dose of {med_name} was {dosage} on {date} at {time_str}.",
-                        "data": {"medication": med_name, "dosage": dosage, "date": date, "time": time_str}
-                    }
-                return {"status": "answer", "message": f"I couldn't find any {med} in your log."}
-
-        return None
+        dosage = row.get('Dosage', '')
+        return {
+            "status": "answer",
+            "message": f"Your last dose of {med_name} was {dosage} on {date} at {time_str}.",
+            "data": {"medication": med_name, "dosage": dosage, "date": date, "time": time_str}
+        }
     
     def extract_medication_info(self, text: str) -> Optional[Dict[str, str]]:
-        """Extract medication name and dosage from text"""
-        text = text.lower().strip()
-        
-        # Enhanced patterns for medication descriptions
-        patterns = [
-            # "I'm taking 10mg of aspirin"
-            r"(?:taking|took|take)\s+(\d+(?:\.\d+)?)\s*(mg|ml|pills?|tablets?|units?|capsules?)\s+(?:of\s+)?(.+)",
-            # "I'm taking aspirin 10mg"
-            r"(?:taking|took|take)\s+(.+?)\s+(\d+(?:\.\d+)?)\s*(mg|ml|pills?|tablets?|units?|capsules?)",
-            # "10mg aspirin"
-            r"(\d+(?:\.\d+)?)\s*(mg|ml|pills?|tablets?|units?|capsules?)\s+(?:of\s+)?(.+)",
-            # "aspirin 10mg"
-            r"(.+?)\s+(\d+(?:\.\d+)?)\s*(mg|ml|pills?|tablets?|units?|capsules?)",
-            # "one pill of aspirin" or "two tablets of tylenol"
-            r"(?:taking|took|take)\s+(one|two|three|four|five|six|seven|eight|nine|ten|a|an)\s+(pill|tablet|capsule)\s+(?:of\s+)?(.+)",
-            # "aspirin one pill"
-            r"(?:taking|took|take)\s+(.+?)\s+(one|two|three|four|five|six|seven|eight|nine|ten|a|an)\s+(pill|tablet|capsule)",
-        ]
-        
-        # Number word to digit mapping
-        number_words = {
-            'one': '1', 'two': '2', 'three': '3', 'four': '4', 'five': '5',
-            'six': '6', 'seven': '7', 'eight': '8', 'nine': '9', 'ten': '10',
-            'a': '1', 'an': '1'
-        }
+        """Extract medication name and dosage from text
+        Expects text already lowercased and stripped by the caller.
+        """
+        # One clock read so date and time always agree, even around midnight
+        now = datetime.now()
         
-        for pattern in patterns:
-            match = re.search(pattern, text)
+        for pat in _EXTRACT_PATTERNS:
+            match = pat.search(text)
             if match:
                 groups = match.groups()
                 
                 if len(groups) == 3:
                     # Handle number words (e.g., "one pill")
-                    if groups[0] in number_words:
-                        dosage = f"{number_words[groups[0]]} {groups[1]}"
+                    if groups[0] in NUMBER_WORDS:
+                        dosage = f"{NUMBER_WORDS[groups[0]]} {groups[1]}"
                         medication = groups[2].strip()
-                    elif groups[1] in number_words:
+                    elif groups[1] in NUMBER_WORDS:
                         medication = groups[0].strip()
-                        dosage = f"{number_words[groups[1]]} {groups[2]}"
+                        dosage = f"{NUMBER_WORDS[groups[1]]} {groups[2]}"
                     # Handle regular numbers
-                    elif groups[0].replace('.', '').isdigit():
+                    elif _NUM_RE.fullmatch(groups[0]):
                         dosage = f"{groups[0]} {groups[1]}"
                         medication = groups[2].strip()
                     else:
@@ -189,36 +352,58 @@ class SimpleMedicationTracker:
                     return {
                         "medication": medication.title(),
                         "dosage": dosage,
-                        "timestamp": datetime.now().strftime("%I:%M %p"),
-                        "date": datetime.now().strftime("%Y-%m-%d")
+                        "timestamp": now.strftime("%I:%M %p"),
+                        "date": now.strftime("%Y-%m-%d")
                     }
         
         # Fallback: try to extract any medication mention
-        cleaned_text = re.sub(r'\b(i am|taking|took|take|some|medication|medicine|pill|tablet|capsule|mg|ml)\b', '', text)
-        cleaned_text = cleaned_text.strip()
+        if any(k in text for k in _FALLBACK_HINTS):
+            cleaned_text = _FALLBACK_SUB.sub('', text).strip()
+        else:
+            cleaned_text = text
         
         if cleaned_text and len(cleaned_text) > 2:
             return {
                 "medication": cleaned_text.title(),
                 "dosage": "Not specified",
-                "timestamp": datetime.now().strftime("%I:%M %p"),
-                "date": datetime.now().strftime("%Y-%m-%d")
+                "timestamp": now.strftime("%I:%M %p"),
+                "date": now.strftime("%Y-%m-%d")
             }
         
         return None
     
+    def extract_bulk(self, texts: Iterable[str]) -> List[Optional[Dict[str, str]]]:
+        """Extract medication info from many transcripts at once (e.g. an imported dump)
+        Returns one result per input text, None where nothing was found.
+        """
+        extract = self.extract_medication_info
+        return [extract(text.strip().lower()) for text in texts]
+    
     def add_medication(self, medication_data: Dict[str, str]) -> bool:
         """Add medication data to CSV file"""
         try:
-            with open(self.csv_file, 'a', newline='', encoding='utf-8') as file:
-                writer = csv.writer(file)
-                writer.writerow([
-                    medication_data["date"],
-                    medication_data["timestamp"],
-                    medication_data["medication"],
-                    medication_data["dosage"],
-                    ""  # Notes column (empty for now)
-                ])
+            row = [
+                medication_data["date"],
+                medication_data["timestamp"],
+                medication_data["medication"],
+                medication_data["dosage"],
+                ""  # Notes column (empty for now)
+            ]
+            with self._write_lock:
+                self._ensure_append_handle()
+                # Only patch the index if it still matches the file; otherwise let it reload
+                index_fresh = self._index_stat is not None and self._stat_key() == self._index_stat
+                self._append_row(row)
+                if index_fresh:
+                    index = dict(self._last_by_med)
+                    self._index_row(index, row)
+                    self._last_by_med = index
+                    if len(row[0]) == 10:
+                        self._dates_in_order = self._dates_in_order and row[0] >= self._last_date
+                        self._last_date = row[0]
+                    self._index_stat = self._stat_key()
+                else:
+                    self._index_stat = None
             
             logger.info(f"✅ Added medication: {medication_data['medication']} - {medication_data['dosage']}")
             return True
@@ -227,52 +412,81 @@ class SimpleMedicationTracker:
             logger.error(f"❌ Error adding medication: {e}")
             return False
     
+    def _tail_offset(self, file, cutoff_bytes: bytes, tail_only: bool) -> Optional[int]:
+        """Return the offset of the first record that may be on or after the cutoff date
+        When tail_only is set (rows are in date order) only the tail of the file needs
+        parsing: the window grows until its first row predates the cutoff. Otherwise
+        this is the first record after the header. Returns None for a file without
+        any records.
+        """
+        size = os.fstat(file.fileno()).st_size
+        if size == 0:
+            return None
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            header_end = mm.find(b'\n') + 1
+            if header_end == 0:
+                return None
+            
+            window = _TAIL_WINDOW
+            while tail_only and size - window > header_end:
+                # Align on the start of a record
+                start = mm.rfind(b'\n', header_end - 1, size - window) + 1
+                first_date = mm[start:start + 11]
+                if first_date[10:] == b',' and first_date[:10] < cutoff_bytes:
+                    return start
+                window *= 2
+            return header_end
+    
+    def iter_recent_medications(self, days: int = 7) -> Iterator[Dict[str, str]]:
+        """Return an iterator over recent medications from CSV, one row at a time
+        Dates are ISO 8601 (YYYY-MM-DD), so they compare correctly as plain strings.
+        Logs whose rows are out of date order (e.g. edited by hand) are scanned in full.
+        A missing log yields nothing. Opening the file and locating the rows happen here,
+        so other I/O errors are raised to the caller; errors while reading rows are
+        logged and end the iteration.
+        """
+        cutoff_str = _cutoff_date(days).isoformat()
+        self._refresh_index()
+        
+        try:
+            file = open(self.csv_file, 'rb')
+        except FileNotFoundError:
+            # A deleted or rotated log is treated as empty, like _load_index does
+            return iter(())
+        try:
+            start = self._tail_offset(file, cutoff_str.encode('ascii'), self._dates_in_order)
+        except BaseException:
+            file.close()
+            raise
+        return self._iter_rows(file, start, cutoff_str)
+    
+    def _iter_rows(self, file, start: Optional[int], cutoff_str: str) -> Iterator[Dict[str, str]]:
+        """Yield rows dated on or after cutoff_str from offset start, closing file when done."""
+        with file:
+            if start is None:
+                return
+            try:
+                file.seek(start)
+                for row in csv.reader(io.TextIOWrapper(file, encoding='utf-8', newline='')):
+                    if len(row) >= 5 and len(row[0]) == 10 and row[0] >= cutoff_str:
+                        yield dict(zip(CSV_HEADER, row))
+            except Exception as e:
+                logger.error(f"❌ Error reading medications: {e}")
+    
     def get_recent_medications(self, days: int = 7) -> List[Dict]:
         """Get recent medications from CSV"""
         try:
-            medications = []
-            cutoff_date = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-            
-            with open(self.csv_file, 'r', newline='', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    try:
-                        med_date = datetime.strptime(row['Date'], '%Y-%m-%d')
-                        if (cutoff_date - med_date).days <= days:
-                            medications.append(row)
-                    except ValueError:
-                        continue
-            
-            return medications
-            
+            return list(self.iter_recent_medications(days))
         except Exception as e:
             logger.error(f"❌ Error reading medications: {e}")
             return []
     
     def process_transcript(self, text: str, session_id: str = None) -> Dict:
         """Process transcript text and return response"""
-        text = text.lower().strip()
-        
-        # Trigger phrases
-        trigger_phrases = [
-            "i am about to take some medication",
-            "i'm about to take some medication", 
-            "about to take medication",
-            "taking medication now",
-            "i am taking medication",
-            "i need to take my medication",
-            "time to take my medication",
-            "remind me to take my medication",
-            "i'm taking my medicine",
-            "medicine time",
-            "pill time",
-            "i'm about to take my pills",
-            "time for my medication",
-            "i'm going to take my medication"
-        ]
+        text = text.strip().lower()
         
         # Check for trigger phrase
-        if any(phrase in text for phrase in trigger_phrases):
+        if TRIGGER_RE.search(text):
             return {
                 "status": "triggered",
                 "message": "Okay, what medication are you taking?",
@@ -289,9 +503,9 @@ class SimpleMedicationTracker:
             if success:
                 return {
                     "status": "logged",
-                    "message": f"Perfect! I've logged {medication_info['medication']} - {medication_info['dosage']} at {medication_info['timestamp']}",
+                    "message": LOGGED_MESSAGE.format_map(medication_info),
                     "data": medication_info,
-                    "response": f"Great! I've recorded that you took {medication_info['medication']} {medication_info['dosage']} at {medication_info['timestamp']}. Your medication has been logged."
+                    "response": LOGGED_RESPONSE.format_map(medication_info)
                 }
             else:
                 return {
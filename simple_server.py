@@ -10,13 +10,16 @@ from pydantic import BaseModel
 from typing import Dict, List, Optional
 import uvicorn
 import logging
+from asyncio import to_thread
 from datetime import datetime
 import os
 import requests
-from fastapi.responses import FileResponse
+from cachetools import TTLCache
+from fastapi.responses import FileResponse, ORJSONResponse, StreamingResponse
+import orjson
 
 # Import our simple tracker
-from simple_medication_tracker import SimpleMedicationTracker
+from simple_medication_tracker import SimpleMedicationTracker, TRIGGER_RE, LOGGED_MESSAGE, LOGGED_RESPONSE
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -26,14 +29,16 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="Simple Medication Tracker",
     description="A lightweight medication tracking app for Omi devices - stores data locally in CSV",
-    version="2.0.0"
+    version="2.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Initialize the tracker
 tracker = SimpleMedicationTracker()
 
 # Store session states (in production, use Redis or database)
-session_states = {}
+# Bounded, and sessions idle for a minute are evicted
+session_states = TTLCache(maxsize=10_000, ttl=60)
 
 class TranscriptData(BaseModel):
     segments: List[Dict]
@@ -116,46 +121,37 @@ async def process_medication_transcript(
     
     # Get the latest transcript segment
     latest_segment = transcript_data.segments[-1] if transcript_data.segments else {}
-    text = latest_segment.get("text", "").lower()
+    # Normalize once here; the tracker methods below expect normalized text
+    text = latest_segment.get("text", "").strip().lower()
+    now = datetime.now()
     
     # Initialize session state if needed
-    if session_id not in session_states:
-        session_states[session_id] = {
+    session_state = session_states.get(session_id)
+    if session_state is None:
+        session_state = {
             "waiting_for_medication": False,
             "last_processed": "",
             "trigger_time": None
         }
+    # (Re)insert so an active session's TTL is refreshed
+    session_states[session_id] = session_state
     
-    session_state = session_states[session_id]
-    
-    # Enhanced trigger phrases - more natural for older adults
-    trigger_phrases = [
-        "i am about to take some medication",
-        "i'm about to take some medication", 
-        "about to take medication",
-        "taking medication now",
-        "i am taking medication",
-        "i need to take my medication",
-        "time to take my medication",
-        "remind me to take my medication",
-        "i'm taking my medicine",
-        "medicine time",
-        "pill time",
-        "i'm about to take my pills",
-        "time for my medication",
-        "i'm going to take my medication"
-    ]
+    # Silence frames and fragments shorter than any trigger or question can't do
+    # anything unless we're waiting for medication details (e.g. "zinc")
+    if len(text) < 5 and not session_state["waiting_for_medication"]:
+        return {"status": "listening"}
     
     # First: see if this is a question we can answer from CSV
-    qa = tracker.answer_question(text)
+    # (blocking file and network work runs in a thread to keep the event loop free)
+    qa = await to_thread(tracker.answer_question, text)
     if qa:
         return qa
 
     # Then: check for trigger phrase
-    if any(phrase in text for phrase in trigger_phrases):
+    if TRIGGER_RE.search(text):
         session_state["waiting_for_medication"] = True
         session_state["last_processed"] = text
-        session_state["trigger_time"] = datetime.now()
+        session_state["trigger_time"] = now
         logger.info(f"🎯 Trigger detected for user {uid}. Waiting for medication details...")
         return {
             "status": "triggered", 
@@ -170,22 +166,22 @@ async def process_medication_transcript(
             medication_info = tracker.extract_medication_info(text)
             
             if medication_info:
-                # Add to CSV
-                success = tracker.add_medication(medication_info)
-                
-                # Reset session state
+                # Reset session state before yielding so a concurrent segment can't log twice
                 session_state["waiting_for_medication"] = False
                 session_state["last_processed"] = text
                 
+                # Add to CSV
+                success = await to_thread(tracker.add_medication, medication_info)
+                
                 if success:
                     # Optionally send to OMI Imports
-                    create_omi_record(uid, medication_info)
+                    await to_thread(create_omi_record, uid, medication_info)
                     logger.info(f"✅ Medication logged successfully: {medication_info}")
                     return {
                         "status": "logged",
-                        "message": f"Perfect! I've logged {medication_info['medication']} - {medication_info['dosage']} at {medication_info['timestamp']}",
+                        "message": LOGGED_MESSAGE.format_map(medication_info),
                         "data": medication_info,
-                        "response": f"Great! I've recorded that you took {medication_info['medication']} {medication_info['dosage']} at {medication_info['timestamp']}. Your medication has been logged."
+                        "response": LOGGED_RESPONSE.format_map(medication_info)
                     }
                 else:
                     return {
@@ -195,7 +191,7 @@ async def process_medication_transcript(
                     }
             else:
                 # If we've been waiting too long, reset the session
-                if session_state["trigger_time"] and (datetime.now() - session_state["trigger_time"]).seconds > 30:
+                if session_state["trigger_time"] and (now - session_state["trigger_time"]).seconds > 30:
                     session_state["waiting_for_medication"] = False
                     session_state["trigger_time"] = None
                     return {
@@ -224,13 +220,18 @@ async def health_check():
 
 @app.get("/medications")
 async def get_medications(uid: str = Query(...), days: int = 7):
-    """Get medication history from CSV"""
+    """Stream medication history from CSV as NDJSON (one JSON object per line)"""
     try:
-        medications = tracker.get_recent_medications(days)
-        return {"medications": medications}
+        # Opens the file and finds the first row up front, so failures get an error status
+        rows = await to_thread(tracker.iter_recent_medications, days)
     except Exception as e:
         logger.error(f"❌ Error in get_medications: {e}")
-        return {"error": "Internal server error"}
+        return ORJSONResponse({"error": "Internal server error"}, status_code=500)
+    # The sync generator is iterated in a threadpool, so file reads stay off the event loop
+    return StreamingResponse(
+        (orjson.dumps(row) + b"\n" for row in rows),
+        media_type="application/x-ndjson"
+    )
 
 @app.get("/download-csv")
 async def download_csv():